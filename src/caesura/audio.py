@@ -1,12 +1,48 @@
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import hashlib
+from itertools import repeat
+import mmap
 from numbers import Number
+import operator
 from pathlib import Path
 import re
-from typing import Any, Sequence
+import struct
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence
 import warnings
 
+_U32BE = struct.Struct(">I")
+_U32LE = struct.Struct("<I")
+_STREAMINFO = struct.Struct(">HH3s3sQ16s")
+_SEEK_POINT = struct.Struct(">QQH")
+_CUE_SHEET = struct.Struct(">128sQB258xB")
+_CUE_TRACK = struct.Struct(">QB12sB13xB")
+_CUE_INDEX = struct.Struct(">QB3x")
+_CUE_SHEET_RESERVED = bytes(258)
+_CUE_TRACK_RESERVED = bytes(13)
+_CUE_INDEX_RESERVED = bytes(3)
+_PICTURE_HEADER = struct.Struct(">II")
+_PICTURE_PROPERTIES = struct.Struct(">5I")
+_VORBIS_KEY_SANITIZE = re.compile("[^\x20-\x3C\x3E-\x7E]")
+
+
+def _bool_to_str(value: bool) -> str:
+    return str(int(value))
+
+
+def _fmt_dt(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+_TO_STRING_DISPATCH = {
+    str: str,
+    bool: _bool_to_str,
+    int: str,
+    float: str,
+    complex: str,
+    datetime: _fmt_dt,
+}
+
 
 class APICFrame:
     # https://id3.org/id3v2.3.0#Attached_picture
@@ -71,69 +107,66 @@ class VorbisComment:
     """
 
     def __init__(
-        self, bytestream: bytes | None = None, /, *, ignore_duplicates: bool = False
+        self,
+        bytestream: bytes | memoryview | None = None,
+        /,
+        *,
+        ignore_duplicates: bool = False,
     ) -> None:
         """
         Parameters
         ----------
-        bytestream : bytes, positional-only, optional
+        bytestream : bytes or memoryview, positional-only, optional
             Bytestream containing a Vorbis comment metadata block.
 
         ignore_duplicates : bool, keyword-only, default: :code:`False`
             Specifies whether to ignore duplicate values in existing fields.
         """
 
-        if isinstance(bytestream, bytes):
-            self._vendor = bytestream[
-                4 : (
-                    byte_offset := 4
-                    + int.from_bytes(bytestream[:4], byteorder="little")
-                )
-            ].decode()
-            self._n_fields = int.from_bytes(
-                bytestream[byte_offset : (byte_offset := byte_offset + 4)],
-                byteorder="little",
+        if isinstance(bytestream, (bytes, memoryview)):
+            vendor_length = _U32LE.unpack_from(bytestream, 0)[0]
+            self._vendor = str(bytestream[4 : 4 + vendor_length], "utf-8")
+            self._n_fields = _U32LE.unpack_from(bytestream, 4 + vendor_length)[0]
+            self._bytestream = (
+                bytestream if isinstance(bytestream, bytes) else bytestream.tobytes()
             )
-            self._fields = {}
-            if ignore_duplicates:
-                for _ in range(self._n_fields):
-                    field_length = int.from_bytes(
-                        bytestream[byte_offset : (byte_offset := byte_offset + 4)],
-                        byteorder="little",
-                    )
-                    field = bytestream[
-                        byte_offset : (byte_offset := byte_offset + field_length)
-                    ].decode()
-                    key, value = field.split("=", 1)
-                    if (key := key.upper()) in self._fields:
-                        self._fields[key][value] = None
-                    else:
-                        self._fields[key] = {value: None}
-                for key, value in self._fields.items():
-                    self._fields[key] = list(value.keys())
-            else:
-                for _ in range(self._n_fields):
-                    field_length = int.from_bytes(
-                        bytestream[byte_offset : (byte_offset := byte_offset + 4)],
-                        byteorder="little",
-                    )
-                    field = bytestream[
-                        byte_offset : (byte_offset := byte_offset + field_length)
-                    ].decode()
-                    key, value = field.split("=", 1)
-                    if (key := key.upper()) in self._fields:
-                        self._fields[key].append(value)
-                    else:
-                        self._fields[key] = [value]
         elif bytestream is None:
             self._vendor = None
             self._n_fields = 0
             self._fields = {}
         else:
-            raise ValueError("If provided, `bytestream` must be a bytes object.")
+            raise ValueError(
+                "If provided, `bytestream` must be a bytes or memoryview object."
+            )
 
         self._ignore_duplicates = ignore_duplicates
 
+    def _parse(self) -> None:
+        """
+        Parse the fields in the bytestream passed to the constructor.
+        """
+
+        bytestream = self._bytestream
+        byte_offset = 8 + _U32LE.unpack_from(bytestream, 0)[0]
+        fields = {}
+        for _ in range(self._n_fields):
+            field_length = _U32LE.unpack_from(bytestream, byte_offset)[0]
+            byte_offset += 4
+            key, separator, value = (
+                bytestream[byte_offset : (byte_offset := byte_offset + field_length)]
+                .decode()
+                .partition("=")
+            )
+            if not separator:
+                raise ValueError("Vorbis comment field without a '=' separator found.")
+            fields.setdefault(key.upper(), []).append(value)
+        if self._ignore_duplicates:
+            fields = {
+                key: list(dict.fromkeys(values)) for key, values in fields.items()
+            }
+        self._fields = fields
+        del self._bytestream
+
     @staticmethod
     def _normalize_key(key: str) -> str:
         """
@@ -151,7 +184,7 @@ class VorbisComment:
             Normalized field name.
         """
 
-        return re.sub("[^\x20-\x3C\x3E-\x7E]", "_", key.upper())
+        return _VORBIS_KEY_SANITIZE.sub("_", key.upper())
 
     @staticmethod
     def _to_string(value: Any) -> Any:
@@ -170,10 +203,11 @@ class VorbisComment:
             type, and the original value otherwise.
         """
 
+        if (to_string := _TO_STRING_DISPATCH.get(type(value))) is not None:
+            return to_string(value)
         return (
             value if isinstance(value, str)
-            else value.strftime("%Y-%m-%dT%H:%M:%SZ") if isinstance(value, datetime)
-            else str(int(value)) if isinstance(value, bool)
+            else _fmt_dt(value) if isinstance(value, datetime)
             else str(value) if isinstance(value, Number)
             else value
         )
@@ -238,20 +272,21 @@ class VorbisComment:
         >>> vc.set(**{"日本語版": True})
         """
 
+        fields = self.fields
         if self._ignore_duplicates:
             new_keys = set()
             for key, value in kwargs.items():
                 if not isinstance(key, str):
                     raise TypeError(f"Field name `{key}` is not a `str`.")
-                if (key := self._normalize_key(key)) not in self._fields:
-                    self._fields[key] = {}
+                if (key := self._normalize_key(key)) not in fields:
+                    fields[key] = {}
                     new_keys.add(key)
                 if isinstance(value := self._to_string(value), str):
-                    self._fields[key][value] = None
+                    fields[key][value] = None
                 elif isinstance(value, Sequence):
                     for item in value:
                         if isinstance(item := self._to_string(item), str):
-                            self._fields[key][item] = None
+                            fields[key][item] = None
                         else:
                             raise TypeError(
                                 f"The value `{item}` for field '{key}' has "
@@ -263,19 +298,19 @@ class VorbisComment:
                         f"unsupported type `{type(value).__name__}`."
                     )
             for key in new_keys:
-                self._fields[key] = list(self._fields[key].keys())
+                fields[key] = list(fields[key].keys())
         else:
             for key, value in kwargs.items():
                 if not isinstance(key, str):
                     raise TypeError("Field names must be strings.")
-                if (key := self._normalize_key(key)) not in self._fields:
-                    self._fields[key] = []
+                if (key := self._normalize_key(key)) not in fields:
+                    fields[key] = []
                 if isinstance(value := self._to_string(value), str):
-                    self._fields[key].append(value)
+                    fields[key].append(value)
                 elif isinstance(value, Sequence):
                     for item in value:
                         if isinstance(item := self._to_string(item), str):
-                            self._fields[key].append(item)
+                            fields[key].append(item)
                         else:
                             raise TypeError(
                                 f"The value `{item}` for field '{key}' has "
@@ -287,13 +322,23 @@ class VorbisComment:
                         f"unsupported type `{type(value).__name__}`."
                     )
 
+    @property
+    def fields(self) -> dict[str, list[str]]:
+        """
+        All fields and their values, keyed by uppercase field name.
+        """
+
+        if not hasattr(self, "_fields"):
+            self._parse()
+        return self._fields
+
     @property
     def album(self) -> list[str] | None:
         """
         Name of the album or collection containing the track.
         """
 
-        return self._fields.get("ALBUM")
+        return self.fields.get("ALBUM")
 
     @property
     def album_artist(self) -> list[str] | None:
@@ -301,7 +346,7 @@ class VorbisComment:
         Main artist(s) of the entire album.
         """
 
-        return self._fields.get("ALBUMARTIST")
+        return self.fields.get("ALBUMARTIST")
 
     @property
     def artist(self) -> list[str] | None:
@@ -311,7 +356,7 @@ class VorbisComment:
         the author of the original text in audiobooks).
         """
 
-        return self._fields.get("ARTIST")
+        return self.fields.get("ARTIST")
 
     @property
     def comment(self) -> list[str] | None:
@@ -319,7 +364,7 @@ class VorbisComment:
         Free-form comment(s) about the track.
         """
 
-        return self._fields.get("COMMENT")
+        return self.fields.get("COMMENT")
 
     @property
     def composer(self) -> list[str] | None:
@@ -327,7 +372,7 @@ class VorbisComment:
         Composer(s) who wrote the track.
         """
 
-        return self._fields.get("COMPOSER")
+        return self.fields.get("COMPOSER")
 
     @property
     def contact(self) -> list[str] | None:
@@ -336,7 +381,7 @@ class VorbisComment:
         track.
         """
 
-        return self._fields.get("CONTACT")
+        return self.fields.get("CONTACT")
 
     @property
     def copyright(self) -> list[str] | None:
@@ -344,7 +389,7 @@ class VorbisComment:
         Copyright attribution for the track or album.
         """
 
-        return self._fields.get("COPYRIGHT")
+        return self.fields.get("COPYRIGHT")
 
     @property
     def date(self) -> list[str] | None:
@@ -352,7 +397,7 @@ class VorbisComment:
         Track release date.
         """
 
-        return self._fields.get("DATE", self._fields.get("YEAR"))
+        return self.fields.get("DATE", self.fields.get("YEAR"))
 
     @property
     def description(self) -> list[str] | None:
@@ -360,7 +405,7 @@ class VorbisComment:
         General description of the track or album.
         """
 
-        return self._fields.get("DESCRIPTION")
+        return self.fields.get("DESCRIPTION")
 
     @property
     def disc_number(self) -> list[str] | None:
@@ -368,7 +413,7 @@ class VorbisComment:
         Disc number within a multi-disc album.
         """
 
-        return self._fields.get("DISCNUMBER")
+        return self.fields.get("DISCNUMBER")
 
     @property
     def disc_total(self) -> list[str] | None:
@@ -376,7 +421,7 @@ class VorbisComment:
         Total number of discs in the album set.
         """
 
-        return self._fields.get("DISCTOTAL")
+        return self.fields.get("DISCTOTAL")
 
     @property
     def encoder(self) -> list[str] | None:
@@ -384,7 +429,7 @@ class VorbisComment:
         Software or hardware used to encode the track.
         """
 
-        return self._fields.get("ENCODER")
+        return self.fields.get("ENCODER")
 
     @property
     def genre(self) -> list[str] | None:
@@ -392,7 +437,7 @@ class VorbisComment:
         Genre(s) of the track.
         """
 
-        return self._fields.get("GENRE")
+        return self.fields.get("GENRE")
 
     @property
     def isrc(self) -> list[str] | None:
@@ -401,7 +446,7 @@ class VorbisComment:
         recording in the track.
         """
 
-        return self._fields.get("ISRC")
+        return self.fields.get("ISRC")
 
     @property
     def license(self) -> list[str] | None:
@@ -409,7 +454,7 @@ class VorbisComment:
         License information for the track or album.
         """
 
-        return self._fields.get("LICENSE")
+        return self.fields.get("LICENSE")
 
     @property
     def location(self) -> list[str] | None:
@@ -417,7 +462,7 @@ class VorbisComment:
         Location where the recording was made.
         """
 
-        return self._fields.get("LOCATION")
+        return self.fields.get("LOCATION")
 
     @property
     def organization(self) -> list[str] | None:
@@ -425,7 +470,7 @@ class VorbisComment:
         Publisher or record label distributing the track.
         """
 
-        return self._fields.get("ORGANIZATION")
+        return self.fields.get("ORGANIZATION")
 
     @property
     def performer(self) -> list[str] | None:
@@ -435,7 +480,7 @@ class VorbisComment:
         in audiobooks).
         """
 
-        return self._fields.get("PERFORMER")
+        return self.fields.get("PERFORMER")
 
     @property
     def title(self) -> list[str] | None:
@@ -443,7 +488,7 @@ class VorbisComment:
         Title of the track.
         """
 
-        return self._fields.get("TITLE")
+        return self.fields.get("TITLE")
 
     @property
     def track_number(self) -> list[str] | None:
@@ -451,7 +496,7 @@ class VorbisComment:
         Track number within the album.
         """
 
-        return self._fields.get("TRACKNUMBER")
+        return self.fields.get("TRACKNUMBER")
 
     @property
     def track_total(self) -> list[str] | None:
@@ -459,7 +504,7 @@ class VorbisComment:
         Total number of tracks in the album.
         """
 
-        return self._fields.get("TRACKTOTAL")
+        return self.fields.get("TRACKTOTAL")
 
     @property
     def version(self) -> list[str] | None:
@@ -467,11 +512,13 @@ class VorbisComment:
         Version of the track (e.g., remix information).
         """
 
-        return self._fields.get("VERSION")
+        return self.fields.get("VERSION")
 
 
 class Audio:
 
+    __slots__ = ("_file_path", "_tags_only", "_validate", "_metadata")
+
     def __init__(
         self,
         file_path: str | Path,
@@ -488,10 +535,18 @@ class Audio:
     def load(self) -> None:
         pass
 
+    @property
+    def metadata(self):
+        if not hasattr(self, "_metadata"):
+            self.load()
+        return self._metadata
+
 
 class FLACAudio(Audio):
     # https://www.xiph.org/flac/format.html
 
+    __slots__ = ()
+
     BLOCK_TYPES = {
         0: "STREAMINFO",
         1: "PADDING",
@@ -513,382 +568,535 @@ class FLACAudio(Audio):
     ) -> None:
         super().__init__(file_path, tags_only=tags_only, validate=validate)
 
-    def load(self) -> None:
+    def _parse_streaminfo(self, block_data: memoryview) -> None:
+        """
+        Parse a STREAMINFO metadata block.
+
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
+
         file_path = self._file_path
         tags_only = self._tags_only
         validate = self._validate
+        block_size = len(block_data)
+        if validate and block_size != 34:
+            raise ValueError(f"Invalid STREAMINFO block size in '{file_path}'.")
+        if tags_only:
+            return
+        (
+            minimum_block_size,
+            maximum_block_size,
+            minimum_frame_size,
+            maximum_frame_size,
+            stream_properties,
+            md5_signature,
+        ) = _STREAMINFO.unpack_from(block_data)
+        if validate and (minimum_block_size < 16 or maximum_block_size < 16):
+            raise ValueError(
+                f"Invalid minimum or maximum stream block size in '{file_path}'."
+            )
+        self._metadata["STREAMINFO"] = {
+            "minimum_block_size": minimum_block_size,
+            "maximum_block_size": maximum_block_size,
+            "minimum_frame_size": int.from_bytes(minimum_frame_size),
+            "maximum_frame_size": int.from_bytes(maximum_frame_size),
+            "sample_rate": stream_properties >> 44,
+            "n_channels": ((stream_properties >> 41) & 0x07) + 1,
+            "bits_per_sample": ((stream_properties >> 36) & 0x1F) + 1,
+            "total_samples": stream_properties & 0xFFFFFFFFF,
+            "md5": md5_signature.hex(),
+        }
+
+    def _parse_padding(self, block_data: memoryview) -> None:
+        """
+        Parse a PADDING metadata block.
 
-        with open(file_path, "rb") as file:
-            if file.read(4) != b"fLaC":
-                raise ValueError(f"'{file_path}' is not a valid FLAC audio file.")
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
+
+        if self._tags_only:
+            return
+        self._metadata["PADDING"] = len(block_data)
+
+    def _parse_application(self, block_data: memoryview) -> None:
+        """
+        Parse an APPLICATION metadata block.
+
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
+
+        file_path = self._file_path
+        tags_only = self._tags_only
+        validate = self._validate
+        block_size = len(block_data)
+        if validate and (block_size - 4) % 8:
+            raise ValueError(f"Invalid APPLICATION block size in '{file_path}'.")
+        if tags_only:
+            return
+        self._metadata["APPLICATION"] = {
+            "id": str(block_data[:4], "utf-8", "replace"),
+            "data": block_data[4:].tobytes(),
+        }
+
+    def _parse_seektable(self, block_data: memoryview) -> None:
+        """
+        Parse a SEEKTABLE metadata block.
+
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
+
+        file_path = self._file_path
+        tags_only = self._tags_only
+        validate = self._validate
+        block_size = len(block_data)
+        n_seek_points, remainder = divmod(block_size, 18)
+        if validate and remainder:
+            raise ValueError(f"Invalid SEEKTABLE block size in '{file_path}'.")
+        if tags_only:
+            return
+        self._metadata["SEEKTABLE"] = seek_table = list(
+            _SEEK_POINT.iter_unpack(block_data[: 18 * n_seek_points])
+        )
+        if validate:
+            # Placeholder points (sample number 0xFFFFFFFFFFFFFFFF)
+            # may only appear at the end of the table, and all
+            # other sample numbers must be strictly increasing.
+            samples = list(map(operator.itemgetter(0), seek_table))
+            while samples and samples[-1] == 0xFFFFFFFFFFFFFFFF:
+                samples.pop()
+            if not all(map(operator.lt, samples, samples[1:])):
+                raise ValueError(f"Invalid SEEKTABLE block in '{file_path}'.")
+
+    def _parse_vorbis_comment(self, block_data: memoryview) -> None:
+        """
+        Parse a VORBIS_COMMENT metadata block.
+
+        The fields are decoded right away when validating, so that a
+        malformed comment is rejected here. Otherwise, they are only
+        decoded on first access.
+
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
+
+        vorbis_comment = VorbisComment(block_data)
+        if self._validate:
+            vorbis_comment.fields
+        self._metadata["VORBIS_COMMENT"] = vorbis_comment
+
+    def _parse_cuesheet(self, block_data: memoryview) -> None:
+        """
+        Parse a CUESHEET metadata block.
+
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
 
-            self._metadata = {}
-            block_header = 0x7F
-            while not block_header & 0x80:
-                block_header = file.read(1)[0]
-                block_size = int.from_bytes(file.read(3))
-                match block_type := block_header & 0x7F:
-                    case 0:
-                        if validate and block_size != 34:
+        file_path = self._file_path
+        tags_only = self._tags_only
+        validate = self._validate
+        if tags_only:
+            return
+        (
+            media_catalog_number,
+            lead_in_samples,
+            cue_sheet_flags,
+            n_tracks,
+        ) = _CUE_SHEET.unpack_from(block_data)
+        if validate and (
+            cue_sheet_flags & 0x7F or block_data[137:395] != _CUE_SHEET_RESERVED
+        ):
+            raise ValueError(
+                "Non-zero bits found in reserved section of "
+                f"CUESHEET block in '{file_path}'."
+            )
+        media_catalog_number = (
+            media_catalog_number.rstrip(b"\x00").decode("utf-8", "replace") or None
+        )
+        cd = bool(cue_sheet_flags & 0x80)
+        if validate:
+            if cd:
+                if media_catalog_number and len(media_catalog_number) != 13:
+                    raise ValueError(
+                        "Invalid media catalog number for CD-DA cue "
+                        f"sheet in '{file_path}'."
+                    )
+                if n_tracks > 100:
+                    raise ValueError(
+                        "More than 100 tracks specified in CD-DA cue "
+                        f"sheet in '{file_path}'."
+                    )
+            elif lead_in_samples:
+                raise ValueError(
+                    "Non-zero number of lead-in samples specified in "
+                    f"non-CD-DA cue sheet in '{file_path}'."
+                )
+            if not n_tracks:
+                raise ValueError(f"No tracks specified in cue sheet in '{file_path}'.")
+            seen_track_numbers = set()
+
+        tracks = [None] * n_tracks
+        byte_offset = 396
+        for track_index in range(n_tracks):
+            (
+                track_offset,
+                track_number,
+                isrc,
+                track_flags,
+                n_index_points,
+            ) = _CUE_TRACK.unpack_from(block_data, byte_offset)
+            if validate:
+                if cd:
+                    if track_offset % 588:
+                        raise ValueError(
+                            f"Invalid offset for track {track_number}"
+                            f"in CD-DA cue sheet in '{file_path}'."
+                        )
+                    if n_index_points > 100:
+                        raise ValueError(
+                            "More than 100 index points specified for "
+                            f"track {track_number} in cue sheet in "
+                            f"'{file_path}'."
+                        )
+                if track_number:
+                    if track_number in seen_track_numbers:
+                        raise ValueError(
+                            "Track with duplicate track number found "
+                            f"in cue sheet in '{file_path}'."
+                        )
+                    seen_track_numbers.add(track_number)
+                else:
+                    raise ValueError(
+                        "Track with track number 0 found in cue "
+                        f"sheet in '{file_path}'."
+                    )
+                if (
+                    track_flags & 0x3F
+                    or block_data[byte_offset + 22 : byte_offset + 35]
+                    != _CUE_TRACK_RESERVED
+                ):
+                    raise ValueError(
+                        "Non-zero bits found in reserved section of "
+                        f"CUESHEET_TRACK for track {track_number} "
+                        f"in '{file_path}'."
+                    )
+            byte_offset += 36
+
+            index_points = [None] * n_index_points
+            for index_point_index in range(n_index_points):
+                index_point_offset, index_point_number = _CUE_INDEX.unpack_from(
+                    block_data, byte_offset
+                )
+                if validate:
+                    if cd and index_point_offset % 588:
+                        raise ValueError(
+                            "Invalid offset for index point "
+                            f"{index_point_number} of track "
+                            f"{track_number} in CD-DA cue sheet in "
+                            f"'{file_path}'."
+                        )
+                    if not index_point_index:
+                        if index_point_number not in {0, 1}:
                             raise ValueError(
-                                f"Invalid STREAMINFO block size in '{file_path}'."
+                                f"First index point in track {track_number} "
+                                f"in cue sheet in '{file_path}' does not have "
+                                "index point number 0 or 1."
                             )
-                        block_data = file.read(block_size)
-                        if tags_only:
-                            continue
-                        minimum_block_size = int.from_bytes(block_data[:2])
-                        maximum_block_size = int.from_bytes(block_data[2:4])
-                        if validate and (
-                            minimum_block_size < 16 or maximum_block_size < 16
+                        if (
+                            block_data[byte_offset + 9 : byte_offset + 12]
+                            != _CUE_INDEX_RESERVED
                         ):
                             raise ValueError(
-                                "Invalid minimum or maximum stream block size in "
-                                f"'{file_path}'."
+                                "Non-zero bits found in reserved section of "
+                                "CUESHEET_TRACK_INDEX for index point "
+                                f"{index_point_number} of track "
+                                f"{track_number} in '{file_path}'."
                             )
-                        self._metadata["STREAMINFO"] = {
-                            "minimum_block_size": minimum_block_size,
-                            "maximum_block_size": maximum_block_size,
-                            "minimum_frame_size": int.from_bytes(block_data[4:7]),
-                            "maximum_frame_size": int.from_bytes(block_data[7:10]),
-                            "sample_rate": int.from_bytes(block_data[10:13]) >> 4,
-                            "n_channels": ((block_data[12] & 0x0E) >> 1) + 1,
-                            "bits_per_sample": ((block_data[12] & 0x01) << 4)
-                            + ((block_data[13] & 0xF0) >> 4)
-                            + 1,
-                            "total_samples": ((block_data[13] & 0x0F) << 32)
-                            + int.from_bytes(block_data[14:18]),
-                            "md5": hashlib.md5(block_data[18:]).hexdigest(),
-                        }
-                    case 1:
-                        file.read(block_size)
-                        if tags_only:
-                            continue
-                        self._metadata["PADDING"] = block_size
-                    case 2:
-                        if validate and (block_size - 4) % 8:
+                        seen_index_point_numbers = {index_point_number}
+                    else:
+                        if index_point_number in seen_index_point_numbers:
                             raise ValueError(
-                                f"Invalid APPLICATION block size in '{file_path}'."
+                                "Index point with duplicate index point "
+                                f"number found for track {track_number} in "
+                                f"cue sheet in '{file_path}'."
                             )
-                        block_data = file.read(block_size)
-                        if tags_only:
-                            continue
-                        self._metadata["APPLICATION"] = {
-                            "id": block_data[:4].decode("utf-8"),
-                            "data": block_data[4:],
-                        }
-                    case 3:
-                        n_seek_points, remainder = divmod(block_size, 18)
-                        if validate and remainder:
+                        seen_index_point_numbers.add(index_point_number)
+                        if index_point_number != previous_index_point_number + 1:
                             raise ValueError(
-                                f"Invalid SEEKTABLE block size in '{file_path}'."
-                            )
-                        block_data = file.read(block_size)
-                        if tags_only:
-                            continue
-                        self._metadata["SEEKTABLE"] = seek_table = [
-                            (
-                                int.from_bytes(
-                                    block_data[(i := 18 * point_index) : (j := i + 8)]
-                                ),
-                                int.from_bytes(block_data[j : (k := j + 8)]),
-                                int.from_bytes(block_data[k : k + 2]),
-                            )
-                            for point_index in range(n_seek_points)
-                        ]
-                        if validate and not all(
-                            seek_table[index][0] < (sample := seek_point[0])
-                            or sample == 0xFFFFFFFFFFFFFFFF
-                            for index, seek_point in enumerate(seek_table[1:])
-                        ):
-                            raise ValueError(
-                                f"Invalid SEEKTABLE block in '{file_path}'."
+                                "Non-sequential index point numbers found "
+                                f"in track {track_number} in cue sheet in "
+                                f"'{file_path}'."
                             )
-                    case 4:
-                        self._metadata["VORBIS_COMMENT"] = VorbisComment(
-                            file.read(block_size)
-                        )
-                    case 5:
-                        block_data = file.read(block_size)
-                        if tags_only:
-                            continue
-                        if validate and (
-                            block_data[136] & 0x7F
-                            or block_data[137:395].rstrip(b"\x00")
-                        ):
+                        if index_point_number > 99:
                             raise ValueError(
-                                "Non-zero bits found in reserved section of "
-                                f"CUESHEET block in '{file_path}'."
+                                f"Index point number greater than 99 for "
+                                f"track {track_number} in cue sheet in "
+                                f"'{file_path}'."
                             )
-                        n_tracks = block_data[395]
-                        byte_offset = 396
-                        self._metadata["CUESHEET"] = cue_sheet = {
-                            "media_catalog_number": block_data[:128]
-                            .decode()
-                            .rstrip("\x00")
-                            or None,
-                            "lead_in_samples": int.from_bytes(block_data[128:136]),
-                            "cd": bool(block_data[136] >> 7),
-                            "n_tracks": n_tracks,
-                            "tracks": [
-                                {
-                                    "offset": int.from_bytes(
-                                        block_data[
-                                            byte_offset : (
-                                                byte_offset := byte_offset + 8
-                                            )
-                                        ]
-                                    ),
-                                    "number": block_data[byte_offset],
-                                    "isrc": "".join(
-                                        str(b)
-                                        for b in block_data[
-                                            byte_offset + 1 : byte_offset + 13
-                                        ]
-                                        if b != 0
-                                    )
-                                    or None,
-                                    "audio": not (
-                                        block_data[byte_offset := byte_offset + 13]
-                                        & 0x80
-                                    ),
-                                    "pre_emphasis": bool(
-                                        block_data[byte_offset] & 0x40
-                                    ),
-                                    "n_index_points": (
-                                        n_index_points := block_data[
-                                            (byte_offset := byte_offset + 15) - 1
-                                        ]
-                                    ),
-                                    "index_points": [
-                                        {
-                                            "offset": int.from_bytes(
-                                                block_data[
-                                                    (byte_offset := byte_offset + 12)
-                                                    - 12 : (
-                                                        index_byte := byte_offset - 4
-                                                    )
-                                                ]
-                                            ),
-                                            "number": block_data[index_byte],
-                                        }
-                                        for _ in range(n_index_points)
-                                    ],
-                                }
-                                for _ in range(n_tracks)
-                            ],
-                        }
-                        if validate:
-                            cd = cue_sheet["cd"]
-                            if cd:
-                                if (
-                                    mcn := cue_sheet["media_catalog_number"]
-                                ) is not None and len(mcn) not in {
-                                    0,
-                                    13,
-                                }:
-                                    raise ValueError(
-                                        "Invalid media catalog number for CD-DA cue "
-                                        f"sheet in '{file_path}'."
-                                    )
-                                if n_tracks > 100:
-                                    raise ValueError(
-                                        "More than 100 tracks specified in CD-DA cue "
-                                        f"sheet in '{file_path}'."
-                                    )
-                            elif cue_sheet["lead_in_samples"]:
-                                raise ValueError(
-                                    "Non-zero number of lead-in samples specified in "
-                                    f"non-CD-DA cue sheet in '{file_path}'."
-                                )
-                            if not n_tracks:
-                                raise ValueError(
-                                    "No tracks specified in cue sheet in "
-                                    f"'{file_path}'."
-                                )
-
-                            seen_track_numbers = set()
-                            byte_offset = 396
-                            for track in cue_sheet["tracks"]:
-                                track_number = track["number"]
-                                if cd:
-                                    if track["offset"] % 588:
-                                        raise ValueError(
-                                            f"Invalid offset for track {track_number}"
-                                            f"in CD-DA cue sheet in '{file_path}'."
-                                        )
-                                    if track["n_index_points"] > 100:
-                                        raise ValueError(
-                                            "More than 100 index points specified for "
-                                            f"track {track_number} in cue sheet in "
-                                            f"'{file_path}'."
-                                        )
-                                if track["number"]:
-                                    if track["number"] in seen_track_numbers:
-                                        raise ValueError(
-                                            "Track with duplicate track number found "
-                                            f"in cue sheet in '{file_path}'."
-                                        )
-                                    seen_track_numbers.add(track["number"])
-                                else:
-                                    raise ValueError(
-                                        "Track with track number 0 found in cue "
-                                        f"sheet in '{file_path}'."
-                                    )
-                                if (
-                                    block_data[byte_offset + 21] & 0x3F
-                                ) or int.from_bytes(
-                                    block_data[byte_offset + 22 : byte_offset + 35]
-                                ):
-                                    raise ValueError(
-                                        "Non-zero bits found in reserved section of "
-                                        f"CUESHEET_TRACK for track {track_number} "
-                                        f"in '{file_path}'."
-                                    )
-
-                                byte_offset += 36
-                                if track["n_index_points"]:
-                                    index_point = track["index_points"][0]
-                                    index_point_number = index_point["number"]
-                                    if cd and index_point["offset"] % 588:
-                                        raise ValueError(
-                                            "Invalid offset for index point "
-                                            f"{index_point_number} of track "
-                                            f"{track_number} in CD-DA cue sheet in "
-                                            f"'{file_path}'."
-                                        )
-                                    if index_point["number"] not in {0, 1}:
-                                        raise ValueError(
-                                            f"First index point in track {track_number} "
-                                            f"in cue sheet in '{file_path}' does not have "
-                                            "index point number 0 or 1."
-                                        )
-                                    if int.from_bytes(
-                                        block_data[byte_offset + 9 : byte_offset + 12]
-                                    ):
-                                        raise ValueError(
-                                            "Non-zero bits found in reserved section of "
-                                            "CUESHEET_TRACK_INDEX for index point "
-                                            f"{index_point_number} of track "
-                                            f"{track_number} in '{file_path}'."
-                                        )
-                                    byte_offset += 12
-                                    seen_index_point_numbers = {index_point_number}
-                                    previous_index_point_number = index_point_number
-                                    for index_point in track["index_points"][1:]:
-                                        index_point_number = index_point["number"]
-                                        if cd and index_point["offset"] % 588:
-                                            raise ValueError(
-                                                "Invalid offset for index point "
-                                                f"{index_point_number} of track "
-                                                f"{track_number} in CD-DA cue sheet in "
-                                                f"'{file_path}'."
-                                            )
-                                        if (
-                                            index_point_number
-                                            in seen_index_point_numbers
-                                        ):
-                                            raise ValueError(
-                                                "Index point with duplicate index point "
-                                                f"number found for track {track_number} in "
-                                                f"cue sheet in '{file_path}'."
-                                            )
-                                        seen_index_point_numbers.add(index_point_number)
-                                        if (
-                                            index_point_number
-                                            != previous_index_point_number + 1
-                                        ):
-                                            raise ValueError(
-                                                "Non-sequential index point numbers found "
-                                                f"in track {track_number} in cue sheet in "
-                                                f"'{file_path}'."
-                                            )
-                                        previous_index_point_number = index_point_number
-                                        if index_point_number > 99:
-                                            raise ValueError(
-                                                f"Index point number greater than 99 for "
-                                                f"track {track_number} in cue sheet in "
-                                                f"'{file_path}'."
-                                            )
-                                        byte_offset += 12
-                            if cd:
-                                if track["number"] != 170:
-                                    raise ValueError(
-                                        "Lead-out track does not have track number 170 in "
-                                        f"CD-DA cue sheet in '{file_path}'."
-                                    )
-                            elif track["number"] != 255:
-                                raise ValueError(
-                                    "Lead-out track does not have track number 255 in "
-                                    f"non-CD-DA cue sheet in '{file_path}'."
-                                )
-                    case 6:
-                        block_data = file.read(block_size)
-                        picture = APICFrame(
-                            picture_type=int.from_bytes(block_data[:4]),
-                            mime_type=block_data[
-                                8 : (byte_offset := 8 + int.from_bytes(block_data[4:8]))
-                            ].decode(),
-                            description=block_data[
-                                byte_offset
-                                + 4 : (
-                                    byte_offset := byte_offset
-                                    + 4
-                                    + int.from_bytes(
-                                        block_data[byte_offset : byte_offset + 4]
-                                    )
-                                )
-                            ].decode(),
-                            width=int.from_bytes(
-                                block_data[
-                                    byte_offset : (byte_offset := byte_offset + 4)
-                                ]
-                            ),
-                            height=int.from_bytes(
-                                block_data[
-                                    byte_offset : (byte_offset := byte_offset + 4)
-                                ]
-                            ),
-                            color_depth=int.from_bytes(
-                                block_data[
-                                    byte_offset : (byte_offset := byte_offset + 4)
-                                ]
-                            ),
-                            n_indexed_colors=int.from_bytes(
-                                block_data[
-                                    byte_offset : (byte_offset := byte_offset + 4)
-                                ]
-                            ),
-                            size=int.from_bytes(
-                                block_data[
-                                    byte_offset : (byte_offset := byte_offset + 4)
-                                ]
-                            ),
-                            data=block_data[byte_offset:],
-                        )
-                        if pictures := self._metadata.get("PICTURE"):
-                            pictures.append(picture)
-                        else:
-                            self._metadata["PICTURE"] = [picture]
-                        # TODO: Check if front or back cover already exists.
-                    case 127:
-                        raise ValueError(
-                            "Metadata block with invalid block type found in "
-                            f"'{file_path}'."
-                        )
-                    case _:
-                        warnings.warn(
-                            f"Skipping metadata block with block type {block_type} "
-                            f"(reserved) found in '{file_path}'."
-                        )
-                        file.read(block_size)
+                    previous_index_point_number = index_point_number
+                byte_offset += 12
+                index_points[index_point_index] = {
+                    "offset": index_point_offset,
+                    "number": index_point_number,
+                }
+
+            tracks[track_index] = {
+                "offset": track_offset,
+                "number": track_number,
+                "isrc": isrc.rstrip(b"\x00").decode("utf-8", "replace") or None,
+                "audio": not track_flags & 0x80,
+                "pre_emphasis": bool(track_flags & 0x40),
+                "n_index_points": n_index_points,
+                "index_points": index_points,
+            }
+
+        if validate:
+            if cd:
+                if track_number != 170:
+                    raise ValueError(
+                        "Lead-out track does not have track number 170 in "
+                        f"CD-DA cue sheet in '{file_path}'."
+                    )
+            elif track_number != 255:
+                raise ValueError(
+                    "Lead-out track does not have track number 255 in "
+                    f"non-CD-DA cue sheet in '{file_path}'."
+                )
 
-        debug = True
+        self._metadata["CUESHEET"] = {
+            "media_catalog_number": media_catalog_number,
+            "lead_in_samples": lead_in_samples,
+            "cd": cd,
+            "n_tracks": n_tracks,
+            "tracks": tracks,
+        }
 
-    @property
-    def metadata(self):
-        if not hasattr(self, "_metadata"):
-            self.load()
-        return self._metadata
+    def _parse_picture(self, block_data: memoryview) -> None:
+        """
+        Parse a PICTURE metadata block.
+
+        Parameters
+        ----------
+        block_data : `memoryview`
+            Contents of the metadata block.
+        """
+
+        picture_type, mime_type_length = _PICTURE_HEADER.unpack_from(block_data)
+        mime_type = str(
+            block_data[8 : (byte_offset := 8 + mime_type_length)], "utf-8", "replace"
+        )
+        description_length = _U32BE.unpack_from(block_data, byte_offset)[0]
+        description = str(
+            block_data[
+                (byte_offset := byte_offset + 4) : (
+                    byte_offset := byte_offset + description_length
+                )
+            ],
+            "utf-8",
+        )
+        (
+            width,
+            height,
+            color_depth,
+            n_indexed_colors,
+            size,
+        ) = _PICTURE_PROPERTIES.unpack_from(block_data, byte_offset)
+        picture = APICFrame(
+            picture_type=picture_type,
+            mime_type=mime_type,
+            description=description,
+            width=width,
+            height=height,
+            color_depth=color_depth,
+            n_indexed_colors=n_indexed_colors,
+            size=size,
+            data=block_data[byte_offset + 20 :].tobytes(),
+        )
+        self._metadata.setdefault("PICTURE", []).append(picture)
+        # TODO: Check if front or back cover already exists.
+
+    _BLOCK_PARSERS = {
+        0: _parse_streaminfo,
+        1: _parse_padding,
+        2: _parse_application,
+        3: _parse_seektable,
+        4: _parse_vorbis_comment,
+        5: _parse_cuesheet,
+        6: _parse_picture,
+    }
+
+    @staticmethod
+    def _read_metadata_blocks(file: BinaryIO) -> bytearray:
+        """
+        Read all metadata blocks from a FLAC file that cannot be
+        memory-mapped (e.g., a pipe).
+
+        Parameters
+        ----------
+        file : `typing.BinaryIO`
+            FLAC file, positioned right after the :code:`fLaC` marker.
+
+        Returns
+        -------
+        buffer : `bytearray`
+            :code:`fLaC` marker followed by all metadata blocks.
+        """
+
+        buffer = bytearray(b"fLaC")
+        block_header = 0
+        while not block_header & 0x80:
+            buffer += (header := file.read(4))
+            block_header = header[0]
+            buffer += file.read(int.from_bytes(header[1:]))
+        return buffer
+
+    def load(self) -> None:
+        file_path = self._file_path
+
+        with open(file_path, "rb") as file:
+            if file.read(4) != b"fLaC":
+                raise ValueError(f"'{file_path}' is not a valid FLAC audio file.")
+            try:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapping = None
+                stream = memoryview(self._read_metadata_blocks(file))
+            else:
+                stream = memoryview(mapping)
+
+        self._metadata = {}
+        block_data = None
+        try:
+            last_block = False
+            position = 4
+            while not last_block:
+                block_header = _U32BE.unpack_from(stream, position)[0]
+                last_block = block_header >> 31
+                block_type = (block_header >> 24) & 0x7F
+                block_size = block_header & 0xFFFFFF
+                block_data = stream[
+                    (position := position + 4) : (position := position + block_size)
+                ]
+                if parse := self._BLOCK_PARSERS.get(block_type):
+                    parse(self, block_data)
+                elif block_type == 127:
+                    raise ValueError(
+                        "Metadata block with invalid block type found in "
+                        f"'{file_path}'."
+                    )
+                else:
+                    warnings.warn(
+                        f"Skipping metadata block with block type {block_type} "
+                        f"(reserved) found in '{file_path}'."
+                    )
+        finally:
+            if block_data is not None:
+                block_data.release()
+            stream.release()
+            if mapping is not None:
+                mapping.close()
+
+
+def _load_flac_metadata(
+    file_path: str | Path, tags_only: bool, validate: bool, picture_data: bool
+) -> dict[str, Any] | Exception:
+    try:
+        metadata = FLACAudio(file_path, tags_only=tags_only, validate=validate).metadata
+        # Decode the Vorbis comment fields in the worker process instead
+        # of on first access in the parent process.
+        if (vorbis_comment := metadata.get("VORBIS_COMMENT")) is not None:
+            vorbis_comment.fields
+    except Exception as exc:
+        return exc
+    if not picture_data:
+        for picture in metadata.get("PICTURE", ()):
+            picture._data = None
+    return metadata
+
+
+def parse_many(
+    file_paths: Iterable[str | Path],
+    /,
+    *,
+    tags_only: bool = True,
+    validate: bool = True,
+    picture_data: bool = True,
+    n_workers: int | None = None,
+    chunksize: int = 64,
+) -> Iterator[tuple[str | Path, dict[str, Any] | Exception]]:
+    """
+    Load the metadata of many FLAC audio files in parallel.
+
+    The files are parsed in a pool of worker processes, so that scanning
+    a large music library is not limited by the global interpreter lock.
+    A file that cannot be read or parsed does not stop the scan; the
+    exception raised for it is yielded in place of its metadata.
+
+    Parameters
+    ----------
+    file_paths : iterable of str or pathlib.Path, positional-only
+        Paths to the FLAC audio files.
+
+    tags_only : bool, keyword-only, default: :code:`True`
+        Specifies whether to only load the Vorbis comment and picture
+        metadata blocks.
+
+    validate : bool, keyword-only, default: :code:`True`
+        Specifies whether to validate the metadata blocks.
+
+    picture_data : bool, keyword-only, default: :code:`True`
+        Specifies whether to return the data of the pictures. If
+        :code:`False`, the data is replaced by :code:`None` in the
+        worker processes, so that cover art is not sent back to the
+        parent process, which otherwise dominates the cost of the scan.
+
+    n_workers : int, keyword-only, optional
+        Number of worker processes. If not specified, the number of
+        processors on the machine is used.
+
+    chunksize : int, keyword-only, default: :code:`64`
+        Number of files sent to a worker process at a time.
+
+    Yields
+    ------
+    file_path : str or pathlib.Path
+        Path to the FLAC audio file.
+
+    metadata : dict or Exception
+        Metadata of the FLAC audio file, in the same format as
+        :attr:`FLACAudio.metadata`, or the exception raised while
+        loading it.
+    """
+
+    file_paths = list(file_paths)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        yield from zip(
+            file_paths,
+            executor.map(
+                _load_flac_metadata,
+                file_paths,
+                repeat(tags_only),
+                repeat(validate),
+                repeat(picture_data),
+                chunksize=chunksize,
+            ),
+        )
 
 
 if __name__ == "__main__":
@@ -915,5 +1123,3 @@ if __name__ == "__main__":
     file = "/mnt/c/Users/Benjamin/Documents/GitHub/caesura/tests/data/flac-test-files/subset/55 - file 48-53 combined.flac"
     flac = FLACAudio(file, tags_only=True)
     data = flac.load()
-
-    debug = True
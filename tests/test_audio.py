@@ -0,0 +1,297 @@
+import struct
+
+import pytest
+
+from caesura.audio import FLACAudio, VorbisComment, parse_many
+
+ISRC = b"USABC1234567"
+MEDIA_CATALOG_NUMBER = b"1234567890123"
+PICTURE_DATA = b"\x89PNG\r\n\x1a\n" + bytes(24)
+
+
+def _block(block_type: int, data: bytes, *, last: bool = False) -> bytes:
+    return bytes([last << 7 | block_type]) + len(data).to_bytes(3, "big") + data
+
+
+def _streaminfo() -> bytes:
+    # 44.1 kHz, 2 channels, 16 bits per sample, 441,000 samples
+    return (
+        struct.pack(">HH", 4096, 4096)
+        + (14).to_bytes(3, "big")
+        + (9999).to_bytes(3, "big")
+        + (44100 << 44 | 1 << 41 | 15 << 36 | 441000).to_bytes(8, "big")
+        + bytes(range(16))
+    )
+
+
+def _cuesheet(*, cd: bool = True) -> bytes:
+    tracks = [
+        (0, 1, ISRC, [(0, 0), (2940, 1)]),
+        (58800, 2, b"", [(0, 1)]),
+        (588000, 170 if cd else 255, b"", []),
+    ]
+    data = (
+        MEDIA_CATALOG_NUMBER.ljust(128, b"\x00")
+        + struct.pack(">QB", 88200 if cd else 0, cd << 7)
+        + bytes(258)
+        + bytes([len(tracks)])
+    )
+    for offset, number, isrc, index_points in tracks:
+        data += struct.pack(
+            ">QB12sB13xB", offset, number, isrc, 0, len(index_points)
+        ) + b"".join(struct.pack(">QB3x", *point) for point in index_points)
+    return data
+
+
+def _vorbis_comment(
+    *fields: str | bytes, vendor: bytes = b"reference libFLAC 1.4.3"
+) -> bytes:
+    data = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(fields))
+    for field in fields:
+        if isinstance(field, str):
+            field = field.encode()
+        data += struct.pack("<I", len(field)) + field
+    return data
+
+
+def _picture(
+    *,
+    mime_type: bytes = b"image/png",
+    description: str = "",
+    data: bytes = PICTURE_DATA,
+) -> bytes:
+    description = description.encode()
+    return (
+        struct.pack(">II", 3, len(mime_type))
+        + mime_type
+        + struct.pack(">I", len(description))
+        + description
+        + struct.pack(">5I", 640, 480, 24, 16, len(data))
+        + data
+    )
+
+
+@pytest.fixture
+def flac_file(tmp_path):
+    def write(
+        *blocks: tuple[int, bytes],
+        cd: bool = True,
+        patch: dict[int, int] | None = None,
+        name: str = "test.flac",
+    ):
+        blocks = [(0, _streaminfo()), *(blocks or [(5, _cuesheet(cd=cd))])]
+        data = bytearray(b"fLaC")
+        for index, (block_type, block_data) in enumerate(blocks, 1):
+            data += _block(block_type, block_data, last=index == len(blocks))
+        for offset, value in (patch or {}).items():
+            data[offset] = value
+        (file_path := tmp_path / name).write_bytes(data)
+        return file_path
+
+    return write
+
+
+# offsets of fields in the CUESHEET block of the test file
+CUESHEET = 4 + 4 + 34 + 4
+TRACK = CUESHEET + 396
+INDEX = TRACK + 36
+
+
+def test_streaminfo(flac_file):
+    assert FLACAudio(flac_file()).metadata["STREAMINFO"] == {
+        "minimum_block_size": 4096,
+        "maximum_block_size": 4096,
+        "minimum_frame_size": 14,
+        "maximum_frame_size": 9999,
+        "sample_rate": 44100,
+        "n_channels": 2,
+        "bits_per_sample": 16,
+        "total_samples": 441000,
+        "md5": "000102030405060708090a0b0c0d0e0f",
+    }
+
+
+@pytest.mark.parametrize("cd", [True, False])
+def test_cuesheet(flac_file, cd):
+    cuesheet = FLACAudio(flac_file(cd=cd)).metadata["CUESHEET"]
+    assert cuesheet["media_catalog_number"] == MEDIA_CATALOG_NUMBER.decode()
+    assert cuesheet["cd"] is cd
+    assert cuesheet["n_tracks"] == 3
+    assert [track["isrc"] for track in cuesheet["tracks"]] == [
+        ISRC.decode(),
+        None,
+        None,
+    ]
+    assert cuesheet["tracks"][0]["index_points"] == [
+        {"offset": 0, "number": 0},
+        {"offset": 2940, "number": 1},
+    ]
+
+
+@pytest.mark.parametrize(
+    "patch, message",
+    [
+        ({CUESHEET + 200: 1}, "reserved section of CUESHEET block"),
+        ({TRACK + 25: 1}, "reserved section of CUESHEET_TRACK for track 1"),
+        ({TRACK + 8: 0}, "track number 0"),
+        ({TRACK + 7: 1}, "Invalid offset for track 1"),
+        ({INDEX + 10: 1}, "reserved section of CUESHEET_TRACK_INDEX"),
+        ({INDEX + 8: 5}, "does not have index point number 0 or 1"),
+        ({INDEX + 20: 2}, "Non-sequential index point numbers"),
+        ({CUESHEET + 13: 65}, "Invalid media catalog number"),
+        ({CUESHEET + 395: 0}, "No tracks specified"),
+    ],
+)
+def test_cuesheet_validation(flac_file, patch, message):
+    with pytest.raises(ValueError, match=message):
+        FLACAudio(flac_file(patch=patch)).load()
+    FLACAudio(flac_file(patch=patch), validate=False).load()
+
+
+VORBIS_COMMENT = _vorbis_comment(
+    "TITLE=I Found U",
+    "artist=Passion Pit",
+    "Artist=Galantis",
+    "ARTIST=Galantis",
+    "COMMENT=a=b",
+    "GENRE=Électro",
+    "日本語=",
+)
+
+
+@pytest.mark.parametrize("bytestream", [VORBIS_COMMENT, memoryview(VORBIS_COMMENT)])
+def test_vorbis_comment(bytestream):
+    assert VorbisComment(bytestream).fields == {
+        "TITLE": ["I Found U"],
+        "ARTIST": ["Passion Pit", "Galantis", "Galantis"],
+        "COMMENT": ["a=b"],
+        "GENRE": ["Électro"],
+        "日本語": [""],
+    }
+
+
+def test_vorbis_comment_ignore_duplicates():
+    vorbis_comment = VorbisComment(VORBIS_COMMENT, ignore_duplicates=True)
+    assert vorbis_comment.artist == ["Passion Pit", "Galantis"]
+    assert vorbis_comment.title == ["I Found U"]
+
+
+@pytest.mark.parametrize(
+    "field, exception",
+    [("TITLE", ValueError), (b"TITLE=I Found \xff", UnicodeDecodeError)],
+)
+def test_vorbis_comment_invalid_field(flac_file, field, exception):
+    bytestream = _vorbis_comment(field)
+
+    # parsing is deferred until the fields are first accessed
+    vorbis_comment = VorbisComment(bytestream)
+    with pytest.raises(exception):
+        vorbis_comment.title
+
+    # but done eagerly when loading and validating a FLAC file
+    file_path = flac_file((4, bytestream))
+    with pytest.raises(exception):
+        FLACAudio(file_path).load()
+    vorbis_comment = FLACAudio(file_path, validate=False).metadata["VORBIS_COMMENT"]
+    with pytest.raises(exception):
+        vorbis_comment.fields
+
+
+@pytest.mark.parametrize("tags_only", [False, True])
+def test_picture(flac_file, tags_only):
+    file_path = flac_file(
+        (6, _picture(description="Cövër")),
+        (6, _picture(mime_type="imagé/png".encode())),
+        (6, _picture(mime_type=b"-->", data=b"https://example.com/cover.png")),
+    )
+    pictures = FLACAudio(file_path, tags_only=tags_only).metadata["PICTURE"]
+    assert [vars(picture) for picture in pictures] == [
+        {
+            "_type": 3,
+            "_mime_type": mime_type,
+            "_description": description,
+            "_width": 640,
+            "_height": 480,
+            "_color_depth": 24,
+            "_n_indexed_colors": 16,
+            "_size": len(data),
+            "_data": data,
+        }
+        for mime_type, description, data in [
+            ("image/png", "Cövër", PICTURE_DATA),
+            ("imagé/png", "", PICTURE_DATA),
+            ("-->", "", "https://example.com/cover.png"),
+        ]
+    ]
+
+
+PLACEHOLDER = 0xFFFFFFFFFFFFFFFF
+
+
+def _seektable(*sample_numbers: int) -> bytes:
+    return b"".join(
+        struct.pack(">QQH", sample_number, 0 if sample_number == PLACEHOLDER else i, 0)
+        for i, sample_number in enumerate(sample_numbers)
+    )
+
+
+@pytest.mark.parametrize(
+    "sample_numbers",
+    [
+        (),
+        (0,),
+        (0, 4096, 8192),
+        (PLACEHOLDER,),
+        (0, 4096, PLACEHOLDER, PLACEHOLDER),
+    ],
+)
+def test_seektable(flac_file, sample_numbers):
+    metadata = FLACAudio(flac_file((3, _seektable(*sample_numbers)))).metadata
+    assert [seek_point[0] for seek_point in metadata["SEEKTABLE"]] == list(
+        sample_numbers
+    )
+
+
+@pytest.mark.parametrize(
+    "sample_numbers",
+    [
+        (0, 0),
+        (4096, 0),
+        (0, 8192, 4096),
+        (0, PLACEHOLDER, 4096),
+        (PLACEHOLDER, 0),
+    ],
+)
+def test_seektable_validation(flac_file, sample_numbers):
+    file_path = flac_file((3, _seektable(*sample_numbers)))
+    with pytest.raises(ValueError, match="Invalid SEEKTABLE block in"):
+        FLACAudio(file_path).load()
+    FLACAudio(file_path, validate=False).load()
+
+
+def test_seektable_block_size(flac_file):
+    with pytest.raises(ValueError, match="Invalid SEEKTABLE block size"):
+        FLACAudio(flac_file((3, _seektable(0) + bytes(1)))).load()
+
+
+def test_parse_many(flac_file):
+    good = flac_file(
+        (4, _vorbis_comment("TITLE=I Found U")), (6, _picture()), name="good.flac"
+    )
+    bad = flac_file((4, _vorbis_comment("TITLE")), name="bad.flac")
+    file_paths = [good, good.with_name("missing.flac"), bad, good]
+    results = list(parse_many(file_paths, n_workers=2, chunksize=1))
+    assert [file_path for file_path, _ in results] == file_paths
+    assert isinstance(results[1][1], FileNotFoundError)
+    assert isinstance(results[2][1], ValueError)
+    for _, metadata in results[::3]:
+        assert metadata["VORBIS_COMMENT"].title == ["I Found U"]
+        assert metadata["PICTURE"][0]._data == PICTURE_DATA
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_parse_many_without_picture_data(flac_file, validate):
+    file_path = flac_file((4, _vorbis_comment("TITLE=I Found U")), (6, _picture()))
+    ((_, metadata),) = parse_many([file_path], validate=validate, picture_data=False)
+    assert not hasattr(metadata["VORBIS_COMMENT"], "_bytestream")
+    assert metadata["PICTURE"][0]._data is None